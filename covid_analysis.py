@@ -1,6 +1,13 @@
 import os
+import hashlib
+import concurrent.futures
+import multiprocessing
+from email.utils import formatdate
 import pandas as pd
 import numpy as np
+import polars as pl
+import matplotlib
+matplotlib.use('Agg')  # headless: no GUI backend needed to write PNGs
 import matplotlib.pyplot as plt
 import seaborn as sns
 import requests
@@ -8,6 +15,23 @@ import requests
 # Set visualization output directory
 VIS_DIR = 'visualization'
 os.makedirs(VIS_DIR, exist_ok=True)
+# Output resolution for saved figures
+PLOT_DPI = 110
+
+# Cached output of load_and_merge_data, rebuilt whenever an input CSV is newer
+MERGED_CACHE = 'merged.parquet'
+# Columns the plots read from the cache; a cache written by an older version without them is rebuilt
+CACHE_REQUIRED_COLS = [
+    'location', 'date', 'confirmed', 'population', 'deaths_per100k',
+    'people_fully_vaccinated_per_hundred', 'stringency_index',
+    'confirmed_per100k_7d', 'deaths_per100k_7d', 'new_cases_per100k_7d', 'new_deaths_per100k_7d'
+]
+
+# OWID fields actually consumed downstream; everything else in the ~70-column file is skipped
+OWID_COLS = [
+    'location', 'date', 'population', 'new_cases', 'new_deaths', 'new_vaccinations',
+    'people_fully_vaccinated_per_hundred', 'stringency_index'
+]
 
 # -------------------------------
 # 1. DATA ACQUISITION & LOADING
@@ -20,9 +44,9 @@ os.makedirs(VIS_DIR, exist_ok=True)
 
 def download_data():
     """
-    Download required COVID-19 datasets if not already present.
+    Download required COVID-19 datasets concurrently, skipping files the server reports unchanged.
     Downloads:
-    - Johns Hopkins CSSE time series (confirmed, deaths, recovered)
+    - Johns Hopkins CSSE time series (confirmed, deaths, and optionally recovered)
     - Our World in Data (OWID) COVID-19 dataset
     - Oxford COVID-19 Government Response Tracker (OxCGRT)
     """
@@ -40,7 +64,9 @@ def download_data():
         {
             'name': 'Johns Hopkins Recovered',
             'url': 'https://raw.githubusercontent.com/CSSEGISandData/COVID-19/master/csse_covid_19_data/csse_covid_19_time_series/time_series_covid19_recovered_global.csv',
-            'path': 'time_series_covid19_recovered_global.csv'
+            'path': 'time_series_covid19_recovered_global.csv',
+            # JHU stopped updating recovered counts in Aug 2021; the analysis runs without it
+            'optional': True
         },
         {
             'name': 'OWID',
@@ -53,149 +79,276 @@ def download_data():
             'path': 'OxCGRT_latest.csv'
         }
     ]
-    for ds in datasets:
-        if not os.path.exists(ds['path']):
-            print(f"Downloading {ds['name']} dataset...")
-            try:
-                r = requests.get(ds['url'], timeout=60)
-                r.raise_for_status()
-                with open(ds['path'], 'wb') as f:
-                    f.write(r.content)
-                print(f"Downloaded {ds['path']}.")
-            except Exception as e:
-                print(f"Failed to download {ds['name']}: {e}")
+    with requests.Session() as session:
+        with concurrent.futures.ThreadPoolExecutor(max_workers=len(datasets)) as ex:
+            list(ex.map(lambda ds: _fetch_one(session, ds), datasets))
+
+
+def _fetch_one(session, ds):
+    """
+    Stream one dataset to disk, skipping the transfer when the local copy is intact and unchanged upstream.
+    Sidecars next to the file remember the server's ETag ('.etag') and the file's SHA-256 ('.sha256').
+    """
+    etag_path = ds['path'] + '.etag'
+    sha_path = ds['path'] + '.sha256'
+    tmp_path = ds['path'] + '.tmp'
+    headers = {}
+    try:
+        if os.path.exists(ds['path']):
+            recorded_sha = _read_sidecar(sha_path)
+            if recorded_sha is not None and recorded_sha != _sha256_file(ds['path']):
+                print(f"{ds['path']} does not match its recorded checksum; downloading again.")
+            else:
+                prev_etag = _read_sidecar(etag_path)
+                if prev_etag is not None:
+                    # Cheap HEAD first: an unchanged ETag means no body transfer at all
+                    head = session.head(ds['url'], allow_redirects=True, timeout=(10, 30))
+                    if head.ok and head.headers.get('ETag') == prev_etag:
+                        print(f"{ds['path']} is up to date. Skipping download.")
+                        return
+                else:
+                    headers['If-Modified-Since'] = formatdate(os.path.getmtime(ds['path']), usegmt=True)
+        print(f"Downloading {ds['name']} dataset...")
+        with session.get(ds['url'], headers=headers, stream=True, timeout=(10, 120)) as r:
+            if r.status_code == 304:
+                print(f"{ds['path']} is up to date. Skipping download.")
+                return
+            r.raise_for_status()
+            # Hash while writing so verification costs no extra pass over the file
+            h = hashlib.sha256()
+            with open(tmp_path, 'wb') as f:
+                for chunk in r.iter_content(1 << 20):
+                    f.write(chunk)
+                    h.update(chunk)
+            os.replace(tmp_path, ds['path'])
+            with open(sha_path, 'w') as f:
+                f.write(h.hexdigest())
+            if r.headers.get('ETag'):
+                with open(etag_path, 'w') as f:
+                    f.write(r.headers['ETag'])
+            elif os.path.exists(etag_path):
+                os.remove(etag_path)
+        print(f"Downloaded {ds['path']}.")
+    except Exception as e:
+        # Never leave a partial download behind
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        if ds.get('optional'):
+            print(f"Failed to download optional {ds['name']} ({e}); continuing without it.")
         else:
-            print(f"{ds['path']} already exists. Skipping download.")
+            print(f"Failed to download {ds['name']}: {e}")
+
+
+def _read_sidecar(path):
+    """Return the stripped contents of a sidecar file, or None if it does not exist."""
+    if not os.path.exists(path):
+        return None
+    with open(path) as f:
+        return f.read().strip()
+
+
+def _sha256_file(path):
+    """SHA-256 hex digest of a file, read in 1 MiB chunks."""
+    h = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            h.update(chunk)
+    return h.hexdigest()
 
 # -------------------------------
 # 2. DATA CLEANING & MERGING
 # -------------------------------
 
-def load_and_merge_data():
+def load_and_merge_data(write_csv=False):
     """
     Load, clean, and merge Johns Hopkins and OWID datasets into a single DataFrame.
-    - Aligns on country and date
+    - Reuses the Parquet cache (MERGED_CACHE) when it is newer than every input and has CACHE_REQUIRED_COLS
+    - Builds one lazy Polars query and collects it once
+    - Aligns on country and date (JHU recovered is merged only if its file is present)
     - Normalizes cases/deaths/vaccinations per 100k population
+    - Adds 7-day rolling means (*_per100k_7d) of the per-100k case/death series
     - Handles missing data
-    - Saves merged dataset as 'merged_covid_dataset.csv'
-    Returns: merged DataFrame
+    - Saves merged dataset to MERGED_CACHE; 'merged_covid_dataset.csv' only if write_csv
+    Returns: merged DataFrame (pandas, Arrow-backed)
     """
-    # Load Johns Hopkins datasets (wide format)
-    df_conf = pd.read_csv('time_series_covid19_confirmed_global.csv')
-    df_deaths = pd.read_csv('time_series_covid19_deaths_global.csv')
-    df_recov = pd.read_csv('time_series_covid19_recovered_global.csv')
-
-    # Melt wide format to long format
-    def melt_jhu(df, value_name):
-        df_long = df.melt(
-            id_vars=['Country/Region', 'Province/State', 'Lat', 'Long'],
-            var_name='date', value_name=value_name
+    recov_path = 'time_series_covid19_recovered_global.csv'
+    has_recov = os.path.exists(recov_path)
+    inputs = [
+        'time_series_covid19_confirmed_global.csv',
+        'time_series_covid19_deaths_global.csv',
+        'owid-covid-data.csv',
+    ] + ([recov_path] if has_recov else [])
+    max_mtime = max(os.path.getmtime(p) for p in inputs)
+    if (os.path.exists(MERGED_CACHE) and os.path.getmtime(MERGED_CACHE) > max_mtime
+            and set(CACHE_REQUIRED_COLS) <= set(pl.read_parquet_schema(MERGED_CACHE))):
+        print(f'Loading cached merged dataset from {MERGED_CACHE}')
+        if write_csv:
+            pl.read_parquet(MERGED_CACHE).write_csv('merged_covid_dataset.csv')
+            print('Merged dataset saved as merged_covid_dataset.csv')
+        return _compact_keys(pd.read_parquet(MERGED_CACHE, dtype_backend='pyarrow'))
+
+    # Aggregate provinces in wide format, then unpivot the country x date matrix to long format
+    def melt_jhu(path, value_name):
+        return (
+            pl.scan_csv(path)
+            # Province and coordinates are discarded by the country aggregation anyway
+            .drop(['Province/State', 'Lat', 'Long'])
+            .group_by('Country/Region')
+            .agg(pl.all().sum().cast(pl.Int32))
+            .sort('Country/Region')
+            .unpivot(index='Country/Region', variable_name='date', value_name=value_name)
+            .with_columns(pl.col('date').str.strptime(pl.Date, '%m/%d/%y'))
+            .rename({'Country/Region': 'location'})
+        )
+
+    jhu_paths = {
+        'confirmed': 'time_series_covid19_confirmed_global.csv',
+        'deaths': 'time_series_covid19_deaths_global.csv',
+    }
+    if has_recov:
+        jhu_paths['recovered'] = recov_path
+
+    # Country x date grid of each JHU file: date header plus the sorted country keys
+    def jhu_grid(path):
+        dates = tuple(pl.scan_csv(path).collect_schema().names()[4:])
+        countries = (
+            pl.scan_csv(path).select(pl.col('Country/Region').unique().sort())
+            .collect().to_series().to_list()
         )
-        # Aggregate by country and date
-        df_long = df_long.groupby(['Country/Region', 'date'], as_index=False)[value_name].sum()
-        return df_long
+        return dates, countries
 
-    df_conf_long = melt_jhu(df_conf, 'confirmed')
-    df_deaths_long = melt_jhu(df_deaths, 'deaths')
-    df_recov_long = melt_jhu(df_recov, 'recovered')
+    grids = {name: jhu_grid(path) for name, path in jhu_paths.items()}
+    if grids['deaths'][0] != grids['confirmed'][0]:
+        raise ValueError('JHU confirmed and deaths files do not cover the same dates')
+    if 'recovered' in grids and grids['recovered'][0] != grids['confirmed'][0]:
+        print(f'{recov_path} covers different dates (JHU stopped updating it); continuing without it.')
+        del jhu_paths['recovered'], grids['recovered']
+    jhu_long = {name: melt_jhu(path, name) for name, path in jhu_paths.items()}
 
-    # Merge JHU datasets
-    df_jhu = df_conf_long.merge(df_deaths_long, on=['Country/Region', 'date'], how='outer')
-    df_jhu = df_jhu.merge(df_recov_long, on=['Country/Region', 'date'], how='outer')
-    df_jhu['date'] = pd.to_datetime(df_jhu['date'], errors='coerce')
-    df_jhu = df_jhu.rename(columns={'Country/Region': 'location'})
+    # Merge JHU datasets: when the files share one country x date grid, the long frames (sorted by
+    # country) line up row for row and sit side by side without a hash join
+    if all(grid == grids['confirmed'] for grid in grids.values()):
+        df_jhu = pl.concat(
+            [jhu_long['confirmed']] + [jhu_long[name].select(name) for name in list(jhu_paths)[1:]],
+            how='horizontal'
+        )
+    else:
+        df_jhu = jhu_long['confirmed']
+        for name in list(jhu_paths)[1:]:
+            df_jhu = df_jhu.join(jhu_long[name], on=['location', 'date'], how='full', coalesce=True)
 
-    # Load OWID dataset
-    df_owid = pd.read_csv('owid-covid-data.csv', parse_dates=['date'])
+    # Load OWID dataset, reading only the columns we use with explicit types
+    df_owid = pl.scan_csv(
+        'owid-covid-data.csv',
+        schema_overrides={'date': pl.Date, **{col: pl.Float64 for col in OWID_COLS[2:]}}
+    ).select(OWID_COLS)
 
     # Merge JHU with OWID on country and date
-    merged = pd.merge(
-        df_jhu,
-        df_owid,
-        left_on=['location', 'date'],
-        right_on=['location', 'date'],
-        how='left',
-        suffixes=('', '_owid')
-    )
-
-    # Fill population from OWID
-    merged['population'] = merged['population'].fillna(method='ffill').fillna(method='bfill')
-    # Normalize per 100k population
-    for col in ['confirmed', 'deaths', 'recovered', 'new_cases', 'new_deaths', 'new_vaccinations']:
-        if col in merged.columns:
-            merged[f'{col}_per100k'] = merged[col] / merged['population'] * 1e5
-
-    # Handle missing values
-    merged = merged.sort_values(['location', 'date'])
-    merged = merged.groupby('location').apply(lambda group: group.fillna(method='ffill')).reset_index(drop=True)
-    merged = merged.fillna(0)
+    merged = df_jhu.join(df_owid, on=['location', 'date'], how='left', suffix='_owid')
+    merged = merged.sort(['location', 'date'])
+
+    # Fill population from OWID within each country so it never leaks across locations
+    merged = merged.with_columns(pl.col('population').forward_fill().backward_fill().over('location'))
+    # Normalize per 100k population: one reciprocal per row, then a float32 multiply per column
+    schema = merged.collect_schema()
+    inv_pop = pl.when(pl.col('population') > 0).then(1e5 / pl.col('population')).cast(pl.Float32)
+    merged = merged.with_columns(inv_pop.alias('_inv_pop')).with_columns([
+        (pl.col(col).cast(pl.Float32) * pl.col('_inv_pop')).alias(f'{col}_per100k')
+        for col in ['confirmed', 'deaths', 'recovered', 'new_cases', 'new_deaths', 'new_vaccinations']
+        if col in schema
+    ]).drop('_inv_pop')
+
+    # Handle missing values: carry the last report forward within each location; values never
+    # reported stay null so downstream statistics can skip them
+    merged = merged.with_columns(pl.all().exclude('location', 'date').forward_fill().over('location'))
+
+    # 7-day rolling means used by the plots, computed once per location
+    merged = merged.with_columns([
+        pl.col(f'{col}_per100k').rolling_mean(7, min_samples=1).over('location').alias(f'{col}_per100k_7d')
+        for col in ['confirmed', 'deaths', 'new_cases', 'new_deaths']
+        if col in schema
+    ])
+
+    # Downcast: counts fit in int32, rates and per-100k values in float32
+    count_cols = ['confirmed', 'deaths', 'recovered', 'new_cases', 'new_deaths', 'new_vaccinations']
+    merged = merged.with_columns(
+        pl.col([col for col in count_cols if col in schema]).cast(pl.Int32),
+        pl.col(pl.Float64).exclude(count_cols).cast(pl.Float32),
+    ).collect(engine='streaming')
 
     # Save merged dataset
-    merged.to_csv('merged_covid_dataset.csv', index=False)
-    print('Merged dataset saved as merged_covid_dataset.csv')
-    return merged
+    merged.write_parquet(MERGED_CACHE, compression='zstd', row_group_size=200_000)
+    print(f'Merged dataset cached as {MERGED_CACHE}')
+    if write_csv:
+        merged.write_csv('merged_covid_dataset.csv')
+        print('Merged dataset saved as merged_covid_dataset.csv')
+    return _compact_keys(merged.to_pandas(use_pyarrow_extension_array=True))
+
+
+def _compact_keys(df):
+    """
+    Store location as a categorical (integer codes for every groupby / isin downstream)
+    and date at second resolution.
+    """
+    df['location'] = df['location'].astype('category')
+    df['date'] = df['date'].astype('datetime64[s]')
+    return df
 
 # -------------------------------
 # 3. ANALYSIS & VISUALIZATION
 # -------------------------------
 
-def plot_cases_by_country(df):
+def plot_cases_by_country(df, top_countries):
     """
-    Enhanced: Plot country-level time series of confirmed, recovered, deaths (top 6 countries by total cases).
+    Enhanced: Plot country-level time series of confirmed cases and deaths (top 6 countries by total cases).
     - Uses 7-day rolling averages for smoother lines.
     - Larger figure, bigger fonts, clear colors, gridlines, separated legend.
     - Saves plot as visualization/cases_by_country_over_time.png
     """
     import matplotlib.dates as mdates
-    top_countries = df.groupby('location')['confirmed'].max().sort_values(ascending=False).head(6).index
-    plt.figure(figsize=(16, 9))
+    groups = dict(iter(df[df['location'].isin(top_countries)].groupby('location', sort=False, observed=True)))
+    fig, ax = plt.subplots(figsize=(16, 9))
     for country in top_countries:
-        country_df = df[df['location'] == country].copy()
-        country_df['cases_7d'] = country_df['confirmed_per100k'].rolling(7, min_periods=1).mean()
-        country_df['deaths_7d'] = country_df['deaths_per100k'].rolling(7, min_periods=1).mean()
-        plt.plot(country_df['date'], country_df['cases_7d'], label=f'{country} (Cases)', linewidth=2)
-        plt.plot(country_df['date'], country_df['deaths_7d'], '--', label=f'{country} (Deaths)', linewidth=2)
-    plt.title('COVID-19 Confirmed Cases and Deaths Over Time (Top 6 Countries, per 100k)', fontsize=18)
-    plt.xlabel('Date', fontsize=14)
-    plt.ylabel('Cases/Deaths per 100k', fontsize=14)
-    plt.xticks(fontsize=12)
-    plt.yticks(fontsize=12)
-    plt.grid(True, linestyle='--', alpha=0.7)
-    plt.legend(loc='upper left', fontsize=12, ncol=2, frameon=True)
-    plt.gca().xaxis.set_major_locator(mdates.YearLocator())
-    plt.gca().xaxis.set_major_formatter(mdates.DateFormatter('%Y-%m'))
-    plt.tight_layout(rect=[0, 0, 1, 0.97])
-    plt.savefig(os.path.join(VIS_DIR, 'cases_by_country_over_time.png'), bbox_inches='tight', dpi=180)
-    plt.close()
-
-
-def plot_deaths_vs_vaccination(df):
+        country_df = groups[country]
+        ax.plot(country_df['date'], country_df['confirmed_per100k_7d'], label=f'{country} (Cases)', linewidth=2)
+        ax.plot(country_df['date'], country_df['deaths_per100k_7d'], '--', label=f'{country} (Deaths)', linewidth=2)
+    ax.set_title('COVID-19 Confirmed Cases and Deaths Over Time (Top 6 Countries, per 100k)', fontsize=18)
+    ax.set_xlabel('Date', fontsize=14)
+    ax.set_ylabel('Cases/Deaths per 100k', fontsize=14)
+    ax.tick_params(labelsize=12)
+    ax.grid(True, linestyle='--', alpha=0.7)
+    ax.legend(loc='upper left', fontsize=12, ncol=2, frameon=True)
+    ax.xaxis.set_major_locator(mdates.YearLocator())
+    ax.xaxis.set_major_formatter(mdates.DateFormatter('%Y-%m'))
+    fig.tight_layout(rect=[0, 0, 1, 0.97])
+    fig.savefig(os.path.join(VIS_DIR, 'cases_by_country_over_time.png'), bbox_inches='tight', dpi=PLOT_DPI)
+    plt.close(fig)
+
+
+def plot_deaths_vs_vaccination(latest_rows):
     """
     Enhanced: Compare deaths vs vaccination rates per capita (latest available date, top 20 countries).
     - Horizontal bar plot with clear color distinction.
     - Larger figure, bigger fonts, separated legends, gridlines.
     - Saves plot as visualization/deaths_vs_vaccination.png
     """
-    latest = df.groupby('location')['date'].max().reset_index()
-    merged_latest = df.merge(latest, on=['location', 'date'], how='inner')
-    merged_latest = merged_latest[merged_latest['population'] > 1e6]
+    merged_latest = latest_rows[latest_rows['population'] > 1e6]
     merged_latest = merged_latest.sort_values('deaths_per100k', ascending=False).head(20)
-    plt.figure(figsize=(14, 10))
-    bar1 = plt.barh(merged_latest['location'], merged_latest['deaths_per100k'], color='tomato', alpha=0.8, label='Deaths per 100k')
-    bar2 = plt.barh(merged_latest['location'], merged_latest['people_fully_vaccinated_per_hundred'], color='mediumseagreen', alpha=0.6, label='Fully Vaccinated (%)')
-    plt.title('Deaths vs Vaccination Rates per Capita (Top 20 Impacted Countries)', fontsize=18)
-    plt.xlabel('Value', fontsize=14)
-    plt.ylabel('Country', fontsize=14)
-    plt.xticks(fontsize=12)
-    plt.yticks(fontsize=12)
-    plt.legend(loc='lower right', fontsize=12, frameon=True)
-    plt.grid(True, axis='x', linestyle='--', alpha=0.7)
-    plt.tight_layout(rect=[0, 0, 1, 0.97])
-    plt.savefig(os.path.join(VIS_DIR, 'deaths_vs_vaccination.png'), bbox_inches='tight', dpi=180)
-    plt.close()
-
-
-def plot_policy_vs_outcomes(df):
+    fig, ax = plt.subplots(figsize=(14, 10))
+    bar1 = ax.barh(merged_latest.index, merged_latest['deaths_per100k'], color='tomato', alpha=0.8, label='Deaths per 100k')
+    bar2 = ax.barh(merged_latest.index, merged_latest['people_fully_vaccinated_per_hundred'], color='mediumseagreen', alpha=0.6, label='Fully Vaccinated (%)')
+    ax.set_title('Deaths vs Vaccination Rates per Capita (Top 20 Impacted Countries)', fontsize=18)
+    ax.set_xlabel('Value', fontsize=14)
+    ax.set_ylabel('Country', fontsize=14)
+    ax.tick_params(labelsize=12)
+    ax.legend(loc='lower right', fontsize=12, frameon=True)
+    ax.grid(True, axis='x', linestyle='--', alpha=0.7)
+    fig.tight_layout(rect=[0, 0, 1, 0.97])
+    fig.savefig(os.path.join(VIS_DIR, 'deaths_vs_vaccination.png'), bbox_inches='tight', dpi=PLOT_DPI)
+    plt.close(fig)
+
+
+def plot_policy_vs_outcomes(df, top_countries):
     """
     Enhanced: Compare policy stringency index vs new cases/deaths for top 4 countries.
     - Uses 7-day rolling averages for new cases/deaths.
@@ -205,22 +358,21 @@ def plot_policy_vs_outcomes(df):
     - Saves plot as visualization/policy_vs_outcomes.png
     """
     import matplotlib.dates as mdates
-    top_countries = df.groupby('location')['confirmed'].max().sort_values(ascending=False).head(4).index
+    subset = df[df['location'].isin(top_countries)].copy()
+    # Fill missing values
+    for col in ['stringency_index', 'new_cases_per100k_7d', 'new_deaths_per100k_7d']:
+        if col not in subset:
+            subset[col] = 0
+        subset[col] = subset[col].fillna(0)
+    # Split the subset into per-country slices in a single pass, keeping the ranking order
+    groups = dict(iter(subset.groupby('location', sort=False, observed=True)))
     fig, axes = plt.subplots(2, 2, figsize=(18, 12), sharex=True)
     for ax, country in zip(axes.flat, top_countries):
-        country_df = df[df['location'] == country].copy()
-        # Fill missing values
-        for col in ['stringency_index', 'new_cases_per100k', 'new_deaths_per100k']:
-            if col not in country_df or country_df[col].isnull().all():
-                country_df[col] = 0
-            country_df[col] = country_df[col].fillna(0)
-        # Rolling averages
-        country_df['cases_7d'] = country_df['new_cases_per100k'].rolling(7, min_periods=1).mean()
-        country_df['deaths_7d'] = country_df['new_deaths_per100k'].rolling(7, min_periods=1).mean()
+        country_df = groups[country]
         ax2 = ax.twinx()
         # Bar plots for cases and deaths
-        ax2.bar(country_df['date'], country_df['cases_7d'], width=4, color='orange', alpha=0.4, label='New Cases (7d avg)')
-        ax2.bar(country_df['date'], country_df['deaths_7d'], width=4, color='red', alpha=0.3, label='New Deaths (7d avg)')
+        ax2.bar(country_df['date'], country_df['new_cases_per100k_7d'], width=4, color='orange', alpha=0.4, label='New Cases (7d avg)')
+        ax2.bar(country_df['date'], country_df['new_deaths_per100k_7d'], width=4, color='red', alpha=0.3, label='New Deaths (7d avg)')
         # Line plot for stringency
         ax.plot(country_df['date'], country_df['stringency_index'], color='blue', lw=2, label='Stringency Index')
         # Titles and labels
@@ -237,10 +389,18 @@ def plot_policy_vs_outcomes(df):
         # Legends
         ax.legend(loc='upper left', fontsize=10, frameon=True)
         ax2.legend(loc='upper right', fontsize=10, frameon=True)
-    plt.tight_layout(rect=[0, 0, 1, 0.97])
-    plt.suptitle('Policy Stringency vs COVID-19 Outcomes (Top 4 Countries)', fontsize=18, y=1.02)
-    plt.savefig(os.path.join(VIS_DIR, 'policy_vs_outcomes.png'), bbox_inches='tight', dpi=180)
-    plt.close()
+    fig.tight_layout(rect=[0, 0, 1, 0.97])
+    fig.suptitle('Policy Stringency vs COVID-19 Outcomes (Top 4 Countries)', fontsize=18, y=1.02)
+    fig.savefig(os.path.join(VIS_DIR, 'policy_vs_outcomes.png'), bbox_inches='tight', dpi=PLOT_DPI)
+    plt.close(fig)
+
+
+# Variables shown in the correlation heatmap (recovered_per100k only when JHU recovered was loaded)
+CORR_COLS = [
+    'confirmed_per100k', 'deaths_per100k', 'recovered_per100k',
+    'new_cases_per100k', 'new_deaths_per100k',
+    'people_fully_vaccinated_per_hundred', 'stringency_index', 'population'
+]
 
 
 def plot_heatmap_correlation(df):
@@ -249,32 +409,57 @@ def plot_heatmap_correlation(df):
     - Larger figure, bigger fonts, clear colorbar, annotated values.
     - Saves plot as visualization/heatmap_correlation.png
     """
-    corr_cols = [
-        'confirmed_per100k', 'deaths_per100k', 'recovered_per100k',
-        'new_cases_per100k', 'new_deaths_per100k',
-        'people_fully_vaccinated_per_hundred', 'stringency_index', 'population'
-    ]
-    df_corr = df[corr_cols].dropna().corr()
-    plt.figure(figsize=(12, 10))
-    sns.heatmap(df_corr, annot=True, fmt='.2f', cmap='coolwarm', cbar_kws={'shrink': 0.8}, annot_kws={"size": 14})
-    plt.title('Correlation Heatmap: Cases, Deaths, Vaccination, Policy, Population', fontsize=18)
-    plt.xticks(fontsize=14, rotation=45, ha='right')
-    plt.yticks(fontsize=14)
-    plt.tight_layout(rect=[0, 0, 1, 0.97])
-    plt.savefig(os.path.join(VIS_DIR, 'heatmap_correlation.png'), bbox_inches='tight', dpi=180)
-    plt.close()
+    corr_cols = [col for col in CORR_COLS if col in df]
+    # Pairwise-complete correlations: missing values stay missing instead of counting as zeros
+    df_corr = df[corr_cols].corr(min_periods=30)
+    fig, ax = plt.subplots(figsize=(12, 10))
+    sns.heatmap(df_corr, annot=True, fmt='.2f', cmap='coolwarm', cbar_kws={'shrink': 0.8}, annot_kws={"size": 14}, ax=ax)
+    ax.set_title('Correlation Heatmap: Cases, Deaths, Vaccination, Policy, Population', fontsize=18)
+    plt.setp(ax.get_xticklabels(), fontsize=14, rotation=45, ha='right')
+    plt.setp(ax.get_yticklabels(), fontsize=14)
+    fig.tight_layout(rect=[0, 0, 1, 0.97])
+    fig.savefig(os.path.join(VIS_DIR, 'heatmap_correlation.png'), bbox_inches='tight', dpi=PLOT_DPI)
+    plt.close(fig)
 
 # -------------------------------
 # 4. MAIN EXECUTION
 # -------------------------------
 
+def _render_from_cache(plot_fn, columns, *args):
+    """
+    Process-pool entry point: load `columns` from MERGED_CACHE and call plot_fn(df, *args).
+    """
+    df = pd.read_parquet(MERGED_CACHE, columns=columns, dtype_backend='pyarrow')
+    if 'location' in df:
+        df = _compact_keys(df)
+    plot_fn(df, *args)
+
+
 def main():
     download_data()
     merged_df = load_and_merge_data()
-    plot_cases_by_country(merged_df)
-    plot_deaths_vs_vaccination(merged_df)
-    plot_policy_vs_outcomes(merged_df)
-    plot_heatmap_correlation(merged_df)
+    # One pass over the merged frame for the per-location summaries every plot needs
+    gb = merged_df.groupby('location', sort=False, observed=True)
+    max_conf = gb['confirmed'].max()
+    # Rows are sorted by date within each location, so the last row is the latest
+    latest_rows = gb.tail(1).set_index('location')
+    top6 = list(max_conf.nlargest(6).index)
+    top4 = list(max_conf.nlargest(4).index)
+    # Render the independent plots in parallel; workers re-read only their columns from the Parquet cache.
+    # 'spawn' because forking after Polars has started its thread pool can deadlock the children.
+    ctx = multiprocessing.get_context('spawn')
+    with concurrent.futures.ProcessPoolExecutor(max_workers=4, mp_context=ctx) as ex:
+        futs = [
+            ex.submit(_render_from_cache, plot_cases_by_country,
+                      ['location', 'date', 'confirmed_per100k_7d', 'deaths_per100k_7d'], top6),
+            ex.submit(plot_deaths_vs_vaccination, latest_rows),
+            ex.submit(_render_from_cache, plot_policy_vs_outcomes,
+                      ['location', 'date', 'stringency_index', 'new_cases_per100k_7d', 'new_deaths_per100k_7d'], top4),
+            ex.submit(_render_from_cache, plot_heatmap_correlation,
+                      [col for col in CORR_COLS if col in merged_df]),
+        ]
+        for f in futs:
+            f.result()
     print('All visualizations saved in the visualization/ folder.')
 
 if __name__ == '__main__':